@@ -1,4 +1,5 @@
 import dataclasses
+import heapq
 from typing import Callable, Dict, List, Protocol, Self, Set, Tuple
 
 from .board_layout import Land
@@ -39,35 +40,45 @@ def distances_from(
     ] = _default_tiebreaker,
 ) -> Tuple[Dict[str, int], Dict[str, str]]:
     visited: Set[str] = set()
-    queue: Dict[str, Land] = {}
+    # vertices are popped by distance, ties going to whichever was discovered
+    # first. stale entries (visited, or since moved closer) are skipped.
+    queue: List[Tuple[int, int, str]] = []
+    lands: Dict[str, Land] = {}
+    order: Dict[str, int] = {}
     dist: Dict[str, int] = {}
     prev: Dict[str, str] = {}
     priority: Dict[str, Comparable] = {}
     dist[land.key] = 0
-    queue[land.key] = land
+    lands[land.key] = land
+    order[land.key] = 0
+    heapq.heappush(queue, (0, 0, land.key))
     priority[land.key] = tiebreaker(land, dist, prev)
     while queue:
-        vertex = min(queue.values(), key=lambda v: dist[v.key])
-        del queue[vertex.key]
-        if vertex.key not in priority:
-            priority[vertex.key] = tiebreaker(vertex, dist, prev)
-        visited.add(vertex.key)
-        base = dist[vertex.key]
+        base, _, vertex_key = heapq.heappop(queue)
+        if vertex_key in visited or base != dist[vertex_key]:
+            continue
+        vertex = lands[vertex_key]
+        if vertex_key not in priority:
+            priority[vertex_key] = tiebreaker(vertex, dist, prev)
+        visited.add(vertex_key)
         for key, link in vertex.links.items():
             if key in visited:
                 continue
-            queue[key] = link.land
+            lands[key] = link.land
             alt = base + link.distance
-            if key in dist and alt > dist[key]:
-                continue
-            if (
-                key in dist
-                and alt == dist[key]
-                and priority[vertex.key] > priority[prev[key]]
-            ):
-                continue
+            if key in dist:
+                if alt > dist[key]:
+                    continue
+                if alt == dist[key]:
+                    if priority[vertex_key] > priority[prev[key]]:
+                        continue
+                    prev[key] = vertex_key
+                    continue
+            else:
+                order[key] = len(order)
             dist[key] = alt
-            prev[key] = vertex.key
+            prev[key] = vertex_key
+            heapq.heappush(queue, (alt, order[key], key))
     return dist, prev
 
 
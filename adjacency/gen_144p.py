@@ -1,7 +1,7 @@
 import argparse
 import functools
 import itertools
-from typing import Callable
+from typing import Callable, Dict, Tuple
 
 import json5
 
@@ -52,6 +52,7 @@ class Map144P(anymap.Map):
     def _load(self) -> None:
         with open("config/144p_board_layout.json5", encoding="utf-8") as f:
             self._data = json5.load(f)
+        self._islet_boards: Dict[Tuple[str, str], Board] = {}
         self._load_continent("blue")
         self._load_continent("orange")
         self._connect_continents()
@@ -74,14 +75,14 @@ class Map144P(anymap.Map):
             rim_ahead,  # 🌙
             data["spokes"],  # 🐍
         ):
-            rim1p = self.boards[f"{rim1}P"]
-            spokep = self.boards[f"{spoke}P"]
-            rim2u = self.boards[f"{rim2}U"]
+            rim1p = self._islet_boards[(rim1, "P")]
+            spokep = self._islet_boards[(spoke, "P")]
+            rim2u = self._islet_boards[(rim2, "U")]
             rim1p.edges[Edge.CLOCK6].link(spokep.edges[Edge.CLOCK3])
             spokep.edges[Edge.CLOCK6].link(rim2u.edges[Edge.CLOCK9])
 
-            rim2s = self.boards[f"{rim2}S"]
-            spokeu = self.boards[f"{spoke}U"]
+            rim2s = self._islet_boards[(rim2, "S")]
+            spokeu = self._islet_boards[(spoke, "U")]
             spokeu.edges[Edge.CLOCK9].link(rim2s.edges[Edge.CLOCK6])
 
         for spoke1, spoke2, hub in zip(
@@ -89,19 +90,19 @@ class Map144P(anymap.Map):
             data["spokes"][1::2],  # ♾️
             data["hub"],  # 🏝️
         ):
-            spoke1s = self.boards[f"{spoke1}S"]
-            hubp = self.boards[f"{hub}P"]
+            spoke1s = self._islet_boards[(spoke1, "S")]
+            hubp = self._islet_boards[(hub, "P")]
             spoke1s.edges[Edge.CLOCK3].link(hubp.edges[Edge.CLOCK3])
 
-            spoke2s = self.boards[f"{spoke2}S"]
-            hubt = self.boards[f"{hub}T"]
+            spoke2s = self._islet_boards[(spoke2, "S")]
+            hubt = self._islet_boards[(hub, "T")]
             spoke2s.edges[Edge.CLOCK3].link(hubt.edges[Edge.CLOCK3])
 
         for i in range(3):
             hub1 = data["hub"][(i + 0) % 3]  # 🏝️
             hub2 = data["hub"][(i + 1) % 3]  # 💖
-            hub1u = self.boards[f"{hub1}U"]
-            hub2r = self.boards[f"{hub2}R"]
+            hub1u = self._islet_boards[(hub1, "U")]
+            hub2r = self._islet_boards[(hub2, "R")]
             hub1u.edges[Edge.CLOCK3].link(hub2r.edges[Edge.CLOCK3])
 
         for i in range(6):
@@ -111,16 +112,20 @@ class Map144P(anymap.Map):
             rim = data["rim"][i]  # 🧀
 
             hub1_letter = "U" if (i % 2 == 0) else "Q"
-            hub1_board = self.boards[f"{hub1}{hub1_letter}"]
+            hub1_board = self._islet_boards[(hub1, hub1_letter)]
             if self._conf.with_ocean:
                 for spoke_letter in "PQR":
-                    self.boards[f"{spoke}{spoke_letter}"].link_archipelago(hub1_board)
-                self.boards[f"{rim}Q"].link_archipelago(hub1_board)
+                    self._islet_boards[(spoke, spoke_letter)].link_archipelago(
+                        hub1_board
+                    )
+                self._islet_boards[(rim, "Q")].link_archipelago(hub1_board)
 
                 hub2_letter = "T" if (i % 2 == 0) else "P"
-                hub2_board = self.boards[f"{hub2}{hub2_letter}"]
+                hub2_board = self._islet_boards[(hub2, hub2_letter)]
                 for spoke_letter in "STU":
-                    self.boards[f"{spoke}{spoke_letter}"].link_archipelago(hub2_board)
+                    self._islet_boards[(spoke, spoke_letter)].link_archipelago(
+                        hub2_board
+                    )
 
     def _load_islet(
         self,
@@ -150,6 +155,7 @@ class Map144P(anymap.Map):
         layout = getattr(Layout, self._data["boards"][name])
         board = Board(name, layout, with_ocean=self._conf.with_ocean)
         self.boards[name] = board
+        self._islet_boards[(islet, letter)] = board
         return board
 
     def _connect_continents(self) -> None:
@@ -161,8 +167,8 @@ class Map144P(anymap.Map):
             self._data["orange"]["rim"],  # 🍌
         ):
             for letter in "PRSTU":
-                rim1_board = self.boards[f"{rim1}{letter}"]
-                rim2_board = self.boards[f"{rim2}{letter}"]
+                rim1_board = self._islet_boards[(rim1, letter)]
+                rim2_board = self._islet_boards[(rim2, letter)]
                 rim1_board.link_archipelago(rim2_board)
 
 
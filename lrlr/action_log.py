@@ -15,7 +15,7 @@ class Action(enum.Enum):
     DOWNGRADE = enum.auto()
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class LogEntry:
     action: Action = Action.COMMENT
     text: Optional[str] = None
@@ -51,6 +51,17 @@ class LogEntry:
             assert len(self.src_piece) == len(self.tgt_piece) == len(self.count)
             yield from zip(self.src_piece, self.tgt_piece, self.count)
 
+    def clone(self) -> Self:
+        clone = dataclasses.replace(self)
+        # piece lists grow in place when later entries are merged into this one
+        if isinstance(self.src_piece, list):
+            clone.src_piece = list(self.src_piece)
+        if isinstance(self.tgt_piece, list):
+            clone.tgt_piece = list(self.tgt_piece)
+        if isinstance(self.count, list):
+            clone.count = list(self.count)
+        return clone
+
     def total_count(self) -> int:
         if isinstance(self.count, int):
             return self.count * self.mult
@@ -58,9 +69,12 @@ class LogEntry:
 
 
 class Actionlog:
-    def __init__(self) -> None:
+    def __init__(self, enabled: bool = True) -> None:
         self._nest = 0
         self.entries: List[Tuple[int, LogEntry]] = []
+        # a disabled log drops every entry. callers on hot paths should check
+        # this before building a LogEntry at all.
+        self.enabled = enabled
 
     @contextlib.contextmanager
     def indent(self) -> Iterator[None]:
@@ -85,6 +99,8 @@ class Actionlog:
         )
 
     def entry(self, entry: LogEntry) -> None:
+        if not self.enabled:
+            return
         match entry.action:
             case Action.COMMENT:
                 assert entry.text
@@ -124,10 +140,16 @@ class Actionlog:
         else:
             self.entries.append((self._nest, entry))
 
+    def clone(self) -> Self:
+        clone = type(self)(enabled=self.enabled)
+        clone._nest = self._nest
+        clone.entries = [(nest, entry.clone()) for nest, entry in self.entries]
+        return clone
+
     @contextlib.contextmanager
     def fork(self) -> Iterator[Self]:
         cls = type(self)
-        fork = cls()
+        fork = cls(enabled=self.enabled)
         fork._nest = self._nest + 1
         try:
             yield fork
@@ -2,11 +2,11 @@ from . import action_log, lair
 
 
 def log_entry_tgt_pieces_to_text(entry: action_log.LogEntry) -> str:
-    return lair.stringify_pieces((tgt, cnt) for _, tgt, cnt in entry.pieces())
+    return lair.stringify_pieces([(tgt, cnt) for _, tgt, cnt in entry.pieces()])
 
 
 def log_entry_src_pieces_to_text(entry: action_log.LogEntry) -> str:
-    return lair.stringify_pieces((src, cnt) for src, _, cnt in entry.pieces())
+    return lair.stringify_pieces([(src, cnt) for src, _, cnt in entry.pieces()])
 
 
 def log_entry_to_text(entry: action_log.LogEntry) -> str:
@@ -47,10 +47,9 @@ def log_entry_to_text(entry: action_log.LogEntry) -> str:
 
 
 def digest_log(log: action_log.Actionlog, filter: str = "") -> str:
-    return "\n".join(
-        " " * (nest * 2) + "- " + line
-        for nest, entry in log.entries
-        for line in (log_entry_to_text(entry),)
-        if line
-        if (nest == 0) or (filter in line)
-    )
+    lines = []
+    for nest, entry in log.entries:
+        line = log_entry_to_text(entry)
+        if line and (nest == 0 or filter in line):
+            lines.append(" " * (nest * 2) + "- " + line)
+    return "\n".join(lines)
@@ -1,33 +1,49 @@
 from __future__ import annotations
 
-import abc
 import contextlib
 import dataclasses
-import itertools
-from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type
+import operator
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
 from adjacency import board_layout, dijkstra, gen_144p
 
 from .action_log import Action, Actionlog, LogEntry
 
+# piece types are plain ints, used as indices into Land.counts
+PieceType = int
 
-@dataclasses.dataclass
-class Pieces:
-    cnt: int
-    tipe: PieceType
+EXPLORER: PieceType = 0
+TOWN: PieceType = 1
+CITY: PieceType = 2
+DAHAN: PieceType = 3
 
-    def __str__(self) -> str:
-        return str(self.cnt)
+INVADERS = (EXPLORER, TOWN, CITY)
+PIECES = (EXPLORER, TOWN, CITY, DAHAN)
 
+HEALTH = (1, 2, 3, 2)
+FEAR = (0, 1, 2, 0)
+# what a piece becomes when downgraded or destroyed. None means nothing is left.
+RESPONSE: Tuple[Optional[PieceType], ...] = (None, EXPLORER, TOWN, None)
 
 LAIR_KEY = "LAIR"
 
+_NOTHING_LEFT_BEHIND = (0, 0, 0, 0)
+
 
-def stringify_pieces(it: Iterator[Tuple[str, int]]) -> str:
+def stringify_pieces(it: Iterable[Tuple[str, int]]) -> str:
     return " ".join(f"{cnt} {piece}" for piece, cnt in it if (cnt and piece)) or "CLEAR"
 
 
 class Land:
+    __slots__ = (
+        "key",
+        "display_name",
+        "land_type",
+        "counts",
+        "mr_counts",
+        "conf",
+    )
+
     def __init__(
         self,
         key: str,  # example: 🌙R4
@@ -42,33 +58,37 @@ class Land:
         self.key = key
         self.display_name = display_name
         self.land_type = land_type
-        self.explorers = Explorer.new(explorers)
-        self.towns = Town.new(towns)
-        self.cities = City.new(cities)
-        self.dahan = Dahan.new(dahan)
-        self.mr_explorers = Explorer.new()
-        self.mr_towns = Town.new()
+        self.counts = [explorers, towns, cities, dahan]
+        self.mr_counts = [0, 0, 0, 0]
         self.conf = conf
 
+    def clone(self) -> Land:
+        land = Land(
+            key=self.key,
+            display_name=self.display_name,
+            land_type=self.land_type,
+            explorers=self.counts[EXPLORER],
+            towns=self.counts[TOWN],
+            cities=self.counts[CITY],
+            dahan=self.counts[DAHAN],
+            conf=self.conf,
+        )
+        land.mr_counts = self.mr_counts.copy()
+        return land
+
     def mr(self) -> None:
-        for tipe in (Explorer, Town, City):
-            mr = tipe.select_mr(self)
-            tipe.select(self).cnt += mr.cnt
-            mr.cnt = 0
+        # only towns and cities respond with pieces (explorers and towns)
+        counts, mr_counts = self.counts, self.mr_counts
+        counts[EXPLORER] += mr_counts[EXPLORER]
+        mr_counts[EXPLORER] = 0
+        counts[TOWN] += mr_counts[TOWN]
+        mr_counts[TOWN] = 0
 
     def total_invaders(self) -> int:
-        return self.explorers.cnt + self.towns.cnt + self.cities.cnt
+        return self.counts[EXPLORER] + self.counts[TOWN] + self.counts[CITY]
 
     def stringify_pieces(self) -> str:
-        return stringify_pieces(
-            (tipe.name(self.conf.piece_names), tipe.select(self).cnt)
-            for tipe in (
-                Explorer,
-                Town,
-                City,
-                Dahan,
-            )
-        )
+        return stringify_pieces(zip(self.conf.piece_names.names(), self.counts))
 
 
 @dataclasses.dataclass
@@ -78,6 +98,15 @@ class PieceNames:
     city: str
     dahan: str
 
+    def names(self) -> Tuple[str, str, str, str]:
+        # indexed by PieceType
+        return (self.explorer, self.town, self.city, self.dahan)
+
+    def name(self, tipe: Optional[PieceType]) -> str:
+        if tipe is None:
+            return ""
+        return self.names()[tipe]
+
 
 piece_names_text = PieceNames(
     explorer="explorer",
@@ -94,131 +123,13 @@ piece_names_emoji = PieceNames(
 )
 
 
-class _PieceType(abc.ABC):
-    @classmethod
-    def new(cls, cnt: int = 0) -> Pieces:
-        return Pieces(cnt=cnt, tipe=cls)
-
-    health: int
-    fear: int
-    response: Optional[PieceType]
-
-    @classmethod
-    @abc.abstractmethod
-    def select(cls, land: Land) -> Pieces:
-        pass
-
-    @classmethod
-    @abc.abstractmethod
-    def select_mr(cls, land: Land) -> Pieces:
-        pass
-
-    @classmethod
-    @abc.abstractmethod
-    def name(cls, pn: PieceNames) -> str:
-        pass
-
-
-PieceType = Type[_PieceType]
-
-
-class Void(_PieceType):
-    health = 0
-    fear = 0
-    response = None
-
-    @classmethod
-    def select(cls, land: Land) -> Pieces:
-        return cls.new()
-
-    @classmethod
-    def select_mr(cls, land: Land) -> Pieces:
-        return cls.new()
-
-    @classmethod
-    def name(cls, pn: PieceNames) -> str:
-        return ""
-
-
-class Explorer(_PieceType):
-    health = 1
-    fear = 0
-    response = Void
-
-    @classmethod
-    def select(cls, land: Land) -> Pieces:
-        return land.explorers
-
-    @classmethod
-    def select_mr(cls, land: Land) -> Pieces:
-        return land.mr_explorers
-
-    @classmethod
-    def name(cls, pn: PieceNames) -> str:
-        return pn.explorer
-
-
-class Town(_PieceType):
-    health = 2
-    fear = 1
-    response = Explorer
-
-    @classmethod
-    def select(cls, land: Land) -> Pieces:
-        return land.towns
-
-    @classmethod
-    def select_mr(cls, land: Land) -> Pieces:
-        return land.mr_towns
-
-    @classmethod
-    def name(cls, pn: PieceNames) -> str:
-        return pn.town
-
-
-class City(_PieceType):
-    health = 3
-    fear = 2
-    response = Town
-
-    @classmethod
-    def select(cls, land: Land) -> Pieces:
-        return land.cities
-
-    @classmethod
-    def select_mr(cls, land: Land) -> Pieces:
-        return Void.new()
-
-    @classmethod
-    def name(cls, pn: PieceNames) -> str:
-        return pn.city
-
-
-class Dahan(_PieceType):
-    health = 2
-    fear = 0
-    response = None
-
-    @classmethod
-    def select(cls, land: Land) -> Pieces:
-        return land.dahan
-
-    @classmethod
-    def select_mr(cls, land: Land) -> Pieces:
-        return Void.new()
-
-    @classmethod
-    def name(cls, pn: PieceNames) -> str:
-        return pn.dahan
-
-
 @dataclasses.dataclass
 class LairInnateConf:
     reserve_gathers: int = 0
     max_range: int = 0
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class LairConf:
     terrain_priority: str = ""
     blue: LairInnateConf = dataclasses.field(default_factory=LairInnateConf)
@@ -232,12 +143,24 @@ class LairConf:
     display_name_range: bool = False
     allow_missing_r1: bool = False
     skip_builds: bool = False
+    _terrain_rank: Dict[str, int] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    _coastal_rank: int = dataclasses.field(init=False, repr=False, compare=False)
+    _ignore_set: FrozenSet[str] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # first occurrence wins, same as str.index()
+        self._terrain_rank = {}
+        for i, land_type in enumerate(self.terrain_priority):
+            self._terrain_rank.setdefault(land_type, i)
+        self._coastal_rank = self._terrain_priority("C")
+        self._ignore_set = frozenset(self.ignore_lands)
 
     def _terrain_priority(self, land_type: str) -> int:
-        try:
-            return self.terrain_priority.index(land_type)
-        except ValueError:
-            return len(self.terrain_priority)
+        return self._terrain_rank.get(land_type, len(self.terrain_priority))
 
     def land_priority(self, land: Optional[Land], terrain: str, coastal: bool) -> int:
         if land and land.key in self.priority_lands:
@@ -245,11 +168,18 @@ class LairConf:
 
         priority = self._terrain_priority(terrain)
         if coastal:
-            priority = min(priority, self._terrain_priority("C"))
+            priority = min(priority, self._coastal_rank)
         return priority
 
+    def is_ignored(self, key: str) -> bool:
+        return key in self._ignore_set
 
-@dataclasses.dataclass
+
+def _dahan_count(land: Land) -> int:
+    return land.counts[DAHAN]
+
+
+@dataclasses.dataclass(slots=True)
 class LairState:
     r0: Land
     lands: List[Land]
@@ -264,6 +194,16 @@ class LairState:
     wasted_dahan_gathers: int = 0
     fear: int = 0
 
+    def clone(self) -> LairState:
+        # the distance maps are never modified once built, so they're shared
+        return dataclasses.replace(
+            self,
+            r0=self.r0.clone(),
+            lands=[land.clone() for land in self.lands],
+            unpathable=[land.clone() for land in self.unpathable],
+            log=self.log.clone(),
+        )
+
 
 def construct_distance_map(
     conf: LairConf,
@@ -285,14 +225,14 @@ def construct_distance_map(
                 assert conf.allow_missing_r1
                 r1_dahan = 0
             else:
-                r1_dahan = lands[key].dahan.cnt
+                r1_dahan = lands[key].counts[DAHAN]
         else:
             r1_dahan = 0  # it's the lair..
 
         prev_land = land.key
         ignored = False
         while prev_land != src:
-            if prev_land in conf.ignore_lands:
+            if conf.is_ignored(prev_land):
                 ignored = True
                 break
             prev_land = prev[prev_land]
@@ -303,6 +243,27 @@ def construct_distance_map(
 
 
 class Lair:
+    __slots__ = (
+        "map",
+        "conf",
+        "uncommitted",
+        "expected_ravages_left",
+        "_r1_dahan",
+        "_r1_by_dahan",
+        "gathers_to",
+        "r1",
+        "state",
+        "mr_lands",
+        "gather_cost",
+        "land_priority",
+        "slurp_priority",
+        "r1_land",
+        "gather_path",
+        "log_order",
+        "piece_name",
+        "leave_behind",
+    )
+
     def __init__(
         self,
         lands: Dict[str, Land],
@@ -314,8 +275,10 @@ class Lair:
     ):
         self.map = map
         self.conf = conf
-        self.uncommitted: List[LogEntry] = []
+        self.uncommitted: List[Tuple[int, LogEntry]] = []
         self.expected_ravages_left = 0
+        self._r1_dahan: Tuple[int, ...] = ()
+        self._r1_by_dahan: Dict[bool, List[Land]] = {}
 
         real_dist, _ = dijkstra.distances_from(ocean_map.land(src))
 
@@ -355,9 +318,30 @@ class Lair:
             dist=dist,
             real_dist=real_dist,
         )
+        # lands that may hold pieces responding to a ravage in r1
+        self.mr_lands = [r0, *self.r1]
         self.gather_cost = {
             key: self._calc_gather_cost(lands[key]) for key in self.gathers_to.keys()
         }
+        self.land_priority = {land.key: self._calc_land_priority(land) for land in r2}
+        # everything but the r1 land's dahan count is fixed for the whole turn
+        self.slurp_priority = {land.key: self._calc_slurp_priority(land) for land in r2}
+        self.r1_land = {land.key: self._calc_r1_land(land) for land in r2}
+        self.gather_path = {land.key: self._calc_gather_path(land) for land in r2}
+        # uncommitted log entries are sorted by their source land's display name
+        self.log_order = {
+            land.key: i
+            for i, land in enumerate(
+                sorted(lands.values(), key=operator.attrgetter("display_name"))
+            )
+        }
+        self.piece_name: Dict[Optional[PieceType], str] = {
+            tipe: conf.piece_names.name(tipe) for tipe in (*PIECES, None)
+        }
+        self.leave_behind = {
+            key: tuple(pieces.get(piece_names_text.name(tipe), 0) for tipe in PIECES)
+            for key, pieces in conf.leave_behind.items()
+        }
 
     def set_expected_ravages(self, ravages: int) -> None:
         self.expected_ravages_left = ravages
@@ -365,6 +349,41 @@ class Lair:
     def _calc_gather_cost(self, land: Land) -> int:
         return self.state.dist[land.key] - 1
 
+    def _calc_r1_land(self, land: Land) -> Land:
+        r1_land = self._r1_gathers_to(land, self.state.dist)
+        assert r1_land
+        return r1_land
+
+    def _calc_gather_path(self, land: Land) -> List[str]:
+        # display names of the lands between `land` and its r1 land
+        path = []
+        last = land
+        for _ in range(self.gather_cost[land.key] - 1):
+            last_gathers_to = self.gathers_to[last.key]
+            assert last_gathers_to
+            last = last_gathers_to
+            path.append(last.display_name)
+        gathers_to = self.gathers_to[last.key]
+        assert gathers_to is self.r1_land[land.key]
+        assert self.state.dist.get(gathers_to.key) == 1
+        return path
+
+    def _calc_slurp_priority(self, land: Land) -> Tuple[int, int, int]:
+        return (
+            self.conf.is_ignored(land.key),
+            # swap `dist` and `land_priority` order to change sorting.
+            # REVISIT make this a toggle?
+            self.state.dist[land.key],
+            self.land_priority[land.key],
+        )
+
+    def _calc_land_priority(self, land: Land) -> int:
+        try:
+            coastal = self.map.land(land.key).coastal
+        except KeyError:
+            coastal = False
+        return self.conf.land_priority(land, land.land_type, coastal)
+
     def _r1_gathers_to(
         self,
         land: Land,
@@ -378,64 +397,63 @@ class Lair:
         return land
 
     def _commit_log(self) -> None:
-        self.uncommitted.sort(key=lambda entry: entry.src_land or "")
-        for entry in self.uncommitted:
+        if len(self.uncommitted) > 1:
+            self.uncommitted.sort(key=operator.itemgetter(0))
+        for _, entry in self.uncommitted:
             self.state.log.entry(entry)
         self.uncommitted = []
 
-    def _noncommit_entry(self, entry: LogEntry) -> None:
-        self.uncommitted.append(entry)
+    def _noncommit_entry(self, land: Land, entry: LogEntry) -> None:
+        self.uncommitted.append((self.log_order[land.key], entry))
 
     def _xchg(
         self,
         src_land: Land,
         src_tipe: PieceType,
-        tgt: Pieces,
+        tgt: List[int],
+        tgt_tipe: Optional[PieceType],
         cnt: int,
     ) -> int:
-        leave = self.conf.leave_behind.get(src_land.key, {}).get(
-            src_tipe.name(piece_names_text), 0
-        )
-        src = src_tipe.select(src_land)
-        actual = min(max(src.cnt - leave, 0), cnt)
-        src.cnt -= actual
-        tgt.cnt += actual
+        leave = self.leave_behind.get(src_land.key, _NOTHING_LEFT_BEHIND)[src_tipe]
+        # same as min(max(available, 0), cnt), minus two builtin calls
+        available = src_land.counts[src_tipe] - leave
+        if available < 0:
+            available = 0
+        actual = cnt if cnt < available else available
+        src_land.counts[src_tipe] -= actual
+        if tgt_tipe is not None:
+            tgt[tgt_tipe] += actual
         return actual
 
     def _gather(self, tipe: PieceType, land: Land, cnt: int, force: bool = True) -> int:
-        if land.key in self.conf.ignore_lands:
+        if cnt <= 0 or self.conf.is_ignored(land.key):
             return 0
+        # the path to r1 is fixed and validated in __init__
         cost = self.gather_cost[land.key]
-        intermediate_lands: List[str] = []
-
-        last: Optional[Land] = land
-        assert last
-        for _ in range(cost - 1):
-            last = self.gathers_to[last.key]
-            assert last
-            intermediate_lands.append(last.display_name)
-        gathers_to = self.gathers_to[last.key]
-        assert gathers_to
-        assert self.state.dist.get(gathers_to.key) == 1
+        r1_land = self.r1_land[land.key]
 
+        gathers_to = r1_land
+        through_r1 = False
         if force or (
-            tipe.health > self.expected_ravages_left and gathers_to.dahan.cnt > 0
+            HEALTH[tipe] > self.expected_ravages_left and r1_land.counts[DAHAN] > 0
         ):
-            if cost:
-                intermediate_lands.append(gathers_to.display_name)
+            through_r1 = cost > 0
             gathers_to = self.state.r0
             cost += 1
-            assert gathers_to
 
         if cost == 0:
             return 0
 
-        gathered = self._xchg(land, tipe, tipe.select(gathers_to), cnt // cost)
+        gathered = self._xchg(land, tipe, gathers_to.counts, tipe, cnt // cost)
         actual = gathered * cost
         self.state.total_gathers += actual
-        if actual:
-            piece_name = tipe.name(self.conf.piece_names)
+        if actual and self.state.log.enabled:
+            piece_name = self.piece_name[tipe]
+            intermediate_lands = list(self.gather_path[land.key])
+            if through_r1:
+                intermediate_lands.append(r1_land.display_name)
             self._noncommit_entry(
+                land,
                 LogEntry(
                     action=Action.GATHER,
                     src_land=land.display_name,
@@ -445,7 +463,7 @@ class Lair:
                     tgt_piece=piece_name,
                     count=gathered,
                     mult=cost,
-                )
+                ),
             )
         return actual
 
@@ -453,51 +471,77 @@ class Lair:
         return self._gather(tipe, land, cnt, force=False)
 
     def _downgrade(self, tipe: PieceType, land: Land, cnt: int) -> int:
-        assert tipe.response
-        actual = self._xchg(land, tipe, tipe.response.select(land), cnt)
-        if actual:
+        if cnt <= 0:
+            return 0
+        response = RESPONSE[tipe]
+        assert response is not None
+        actual = self._xchg(land, tipe, land.counts, response, cnt)
+        if actual and self.state.log.enabled:
             self._noncommit_entry(
+                land,
                 LogEntry(
                     action=Action.DOWNGRADE,
                     src_land=land.display_name,
-                    src_piece=tipe.name(self.conf.piece_names),
+                    src_piece=self.piece_name[tipe],
                     tgt_land=land.display_name,
-                    tgt_piece=tipe.response.name(self.conf.piece_names),
+                    tgt_piece=self.piece_name[response],
                     count=actual,
-                )
+                ),
             )
         return actual
 
     def _lair1(self) -> None:
         r0 = self.state.r0
-        downgrades = (r0.explorers.cnt + r0.dahan.cnt) // 3
-        self.state.log.entry(LogEntry(text=f"available downgrades: {downgrades}"))
-        downgrades -= self._downgrade(Town, r0, downgrades)
-        downgrades -= self._downgrade(City, r0, downgrades)
+        downgrades = (r0.counts[EXPLORER] + r0.counts[DAHAN]) // 3
+        if self.state.log.enabled:
+            self.state.log.entry(LogEntry(text=f"available downgrades: {downgrades}"))
+        downgrades -= self._downgrade(TOWN, r0, downgrades)
+        downgrades -= self._downgrade(CITY, r0, downgrades)
         self.state.wasted_downgrades += downgrades
 
+    def _r1_sorted_by_dahan(self, most: bool) -> List[Land]:
+        # dahan may also move outside of the lair's own actions (delayed csv
+        # actions), so compare against a snapshot instead of tracking writes.
+        r1_dahan = tuple(land.counts[DAHAN] for land in self.r1)
+        if r1_dahan != self._r1_dahan:
+            self._r1_dahan = r1_dahan
+            self._r1_by_dahan = {}
+        if (cached := self._r1_by_dahan.get(most)) is not None:
+            return cached
+        # reverse=True keeps ties in their original order, like a negated key
+        ret = sorted(self.r1, key=_dahan_count, reverse=most)
+        self._r1_by_dahan[most] = ret
+        return ret
+
     def _r1_least_dahan(self) -> List[Land]:
-        return sorted(self.r1, key=lambda land: land.dahan.cnt)
+        return self._r1_sorted_by_dahan(most=False)
 
     def _r1_most_dahan(self) -> List[Land]:
-        return sorted(self.r1, key=lambda land: -land.dahan.cnt)
+        return self._r1_sorted_by_dahan(most=True)
 
     def _lair2(self) -> None:
+        # invader gathers don't move dahan, so one ordering serves both piece types
+        r1 = self._r1_most_dahan()
         gathers = 1
-        for tipe in (Explorer, Town):
-            for land in self._r1_most_dahan():
+        for tipe in (EXPLORER, TOWN):
+            for land in r1:
+                if not gathers:
+                    break
                 gathers -= self._gather(tipe, land, gathers)
         self.state.wasted_invader_gathers += gathers
 
         gathers = 1
-        for land in self._r1_most_dahan():
-            gathers -= self._gather(Dahan, land, gathers)
+        for land in r1:
+            if not gathers:
+                break
+            gathers -= self._gather(DAHAN, land, gathers)
         self.state.wasted_dahan_gathers += gathers
 
     def _reserve(self, reserve: int, what: str, cnt: int) -> int:
         if reserve:
             to_reserve = min(cnt, reserve)
-            self.state.log.entry(LogEntry(text=f"reserved {to_reserve} {what}"))
+            if self.state.log.enabled:
+                self.state.log.entry(LogEntry(text=f"reserved {to_reserve} {what}"))
             return to_reserve
         return 0
 
@@ -505,56 +549,50 @@ class Lair:
         self,
         land: Land,
     ) -> Tuple[int, int, int, int]:
-        try:
-            coastal = self.map.land(land.key).coastal
-        except KeyError:
-            coastal = False
-        land_priority = self.conf.land_priority(land, land.land_type, coastal)
-
-        dist = self.state.dist[land.key]
-        r1_land = self._r1_gathers_to(land, self.state.dist)
-        assert r1_land
-
-        ignored = land.key in self.conf.ignore_lands
-
-        return (
-            ignored,
-            # swap `dist` and `land_priority` order to change sorting.
-            # REVISIT make this a toggle?
-            dist,
-            land_priority,
-            r1_land.dahan.cnt,
-        )
+        ignored, dist, land_priority = self.slurp_priority[land.key]
+        return (ignored, dist, land_priority, self.r1_land[land.key].counts[DAHAN])
 
     def _lair3(self, conf: LairInnateConf) -> None:
         r0 = self.state.r0
-        gathers = (r0.explorers.cnt + r0.dahan.cnt) // 6
-        self.state.log.entry(LogEntry(text=f"available gathers: {gathers}"))
+        gathers = (r0.counts[EXPLORER] + r0.counts[DAHAN]) // 6
+        if self.state.log.enabled:
+            self.state.log.entry(LogEntry(text=f"available gathers: {gathers}"))
         with self.state.log.indent():
             gathers -= self._reserve(conf.reserve_gathers, "gathers", gathers)
 
-        for land in sorted(
-            self.state.lands,
-            key=self._least_r1_dahan_land_priority_key,
-        ):
-            if self.state.dist[land.key] > conf.max_range:
-                continue
-            gathers -= self._slurp(City, land, gathers)
-            gathers -= self._slurp(Town, land, gathers)
-            gathers -= self._slurp(Explorer, land, gathers)
-        self._commit_log()
+        # skip ordering every land when there is nothing to gather with
+        if gathers:
+            for land in sorted(
+                self.state.lands,
+                key=self._least_r1_dahan_land_priority_key,
+            ):
+                if not gathers:
+                    break
+                if self.state.dist[land.key] > conf.max_range:
+                    continue
+                gathers -= self._slurp(CITY, land, gathers)
+                gathers -= self._slurp(TOWN, land, gathers)
+                gathers -= self._slurp(EXPLORER, land, gathers)
+            self._commit_log()
 
-        for land in self._r1_most_dahan():
-            gathers -= self._gather(Explorer, land, gathers)
-        self._commit_log()
+            for land in self._r1_most_dahan():
+                if not gathers:
+                    break
+                gathers -= self._gather(EXPLORER, land, gathers)
+            self._commit_log()
 
-        self.state.log.entry(
-            LogEntry(text=f"unused gathers left at end of slurp: {gathers}")
-        )
+        if self.state.log.enabled:
+            self.state.log.entry(
+                LogEntry(text=f"unused gathers left at end of slurp: {gathers}")
+            )
         self.state.wasted_invader_gathers += gathers
 
     @contextlib.contextmanager
     def _top_log(self, what: str) -> Iterator[None]:
+        if not self.state.log.enabled:
+            yield
+            self._commit_log()
+            return
         oldlog = self.state.log
         with self.state.log.fork() as newlog:
             self.state.log = newlog
@@ -587,30 +625,38 @@ class Lair:
         tipe: PieceType,
         gathers: int,
     ) -> int:
+        if not gathers:
+            return 0
         for land in it():
+            if not gathers:
+                break
             gathers -= self._gather(tipe, land, gathers)
         return gathers
 
     def call(self) -> None:
         with self._top_log("call"):
-            wasted_invaders_gathers = self._call_one(self._r1_most_dahan, Town, 5)
-            wasted_invaders_gathers += self._call_one(self._r1_most_dahan, Explorer, 15)
+            wasted_invaders_gathers = self._call_one(self._r1_most_dahan, TOWN, 5)
+            wasted_invaders_gathers += self._call_one(self._r1_most_dahan, EXPLORER, 15)
             self.state.wasted_invader_gathers += wasted_invaders_gathers
             self.state.wasted_dahan_gathers += self._call_one(
-                self._r1_least_dahan, Dahan, 5
+                self._r1_least_dahan, DAHAN, 5
             )
             self._commit_log()
-            self.state.log.entry(
-                LogEntry(
-                    text=f"unused gathers left at end of call: {wasted_invaders_gathers}"
+            if self.state.log.enabled:
+                self.state.log.entry(
+                    LogEntry(
+                        text=f"unused gathers left at end of call: {wasted_invaders_gathers}"
+                    )
                 )
-            )
 
     def _damage(self, land: Land, tipe: PieceType, dmg: int) -> int:
+        health = HEALTH[tipe]
+        if dmg < health:
+            return 0
         assert land.key in self.gathers_to
 
         respond_to: Optional[Land]
-        if land.dahan.cnt:
+        if land.counts[DAHAN]:
             respond_to = land
         else:
             if self.state.dist[land.key] == 1:
@@ -619,50 +665,65 @@ class Lair:
                 respond_to = self.gathers_to[land.key]
         assert respond_to
 
-        assert tipe.response
-        response = tipe.response.select_mr(respond_to)
-        kill = self._xchg(land, tipe, response, dmg // tipe.health)
-        if kill:
+        assert tipe != DAHAN
+        response = RESPONSE[tipe]
+        kill = self._xchg(land, tipe, respond_to.mr_counts, response, dmg // health)
+        if kill and self.state.log.enabled:
             self._noncommit_entry(
+                land,
                 LogEntry(
                     action=Action.DESTROY,
                     src_land=land.display_name,
-                    src_piece=tipe.name(self.conf.piece_names),
+                    src_piece=self.piece_name[tipe],
                     tgt_land=respond_to.display_name,
-                    tgt_piece=tipe.response.name(self.conf.piece_names),
+                    tgt_piece=self.piece_name[response],
                     count=kill,
-                )
+                ),
             )
-        self.state.fear += kill * tipe.fear
-        return kill * tipe.health
+        self.state.fear += kill * FEAR[tipe]
+        return kill * health
 
     def _ravage(self) -> None:
         self.expected_ravages_left -= 1
 
         r0 = self.state.r0
-        dmg = max(0, r0.explorers.cnt - 6) + r0.towns.cnt * 2 + r0.cities.cnt * 3
+        dmg = (
+            max(0, r0.counts[EXPLORER] - 6)
+            + r0.counts[TOWN] * HEALTH[TOWN]
+            + r0.counts[CITY] * HEALTH[CITY]
+        )
         fear_before = self.state.fear
 
-        lands = sorted(
-            self.r1,
-            key=self._least_r1_dahan_land_priority_key,
-        )
-        for land in lands:
-            dmg -= self._damage(land, Town, dmg)
-            dmg -= self._damage(land, City, dmg)
-        for land in lands:
-            dmg -= self._damage(land, Explorer, dmg)
+        # skip ordering r1 when r0 has nothing left to ravage with
+        if dmg:
+            lands = sorted(
+                self.r1,
+                key=self._least_r1_dahan_land_priority_key,
+            )
+            # towns and cities take precedence over explorers in all lands, so
+            # this can't be a single pass. stop each pass once we're out of
+            # damage though.
+            for land in lands:
+                if not dmg:
+                    break
+                dmg -= self._damage(land, TOWN, dmg)
+                dmg -= self._damage(land, CITY, dmg)
+            for land in lands:
+                if not dmg:
+                    break
+                dmg -= self._damage(land, EXPLORER, dmg)
 
         self._commit_log()
-        self.state.log.entry(
-            LogEntry(text=f"unused damage left at end of ravage: {dmg}")
-        )
-        self.state.log.entry(
-            LogEntry(text=f"fear caused by ravage: {self.state.fear - fear_before}")
-        )
+        if self.state.log.enabled:
+            self.state.log.entry(
+                LogEntry(text=f"unused damage left at end of ravage: {dmg}")
+            )
+            self.state.log.entry(
+                LogEntry(text=f"fear caused by ravage: {self.state.fear - fear_before}")
+            )
         self.state.wasted_damage += dmg
 
-        for land in itertools.chain([self.state.r0], self.r1):
+        for land in self.mr_lands:
             land.mr()
 
     def ravage(self) -> None:
@@ -670,33 +731,36 @@ class Lair:
             self._ravage()
 
     def _add(self, land: Land, tipe: PieceType, cnt: int) -> None:
-        tipe.select(land).cnt += cnt
+        land.counts[tipe] += cnt
+        if not self.state.log.enabled:
+            return
         self.state.log.entry(
             LogEntry(
                 action=Action.ADD,
                 tgt_land=land.display_name,
-                tgt_piece=tipe.name(self.conf.piece_names),
+                tgt_piece=self.piece_name[tipe],
                 count=cnt,
             )
         )
 
     def _build(self, land: Land) -> None:
-        if self.conf.skip_builds or all(
-            tipe.select(land).cnt == 0 for tipe in (Explorer, Town, City)
+        counts = land.counts
+        if self.conf.skip_builds or not (
+            counts[EXPLORER] or counts[TOWN] or counts[CITY]
         ):
             return
 
         tipe: PieceType
-        if land.towns.cnt > land.cities.cnt:
-            tipe = City
+        if land.counts[TOWN] > land.counts[CITY]:
+            tipe = CITY
         else:
-            tipe = Town
+            tipe = TOWN
         self._add(land, tipe, 1)
 
     def blur(self) -> None:
         with self._top_log("blur"):
-            if self.state.r0.dahan.cnt > 0:
-                self._add(self.state.r0, Dahan, 1)
+            if self.state.r0.counts[DAHAN] > 0:
+                self._add(self.state.r0, DAHAN, 1)
             self._build(self.state.r0)
             self._ravage()
 
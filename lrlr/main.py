@@ -3,13 +3,14 @@ import copy
 import csv
 import dataclasses
 import enum
+import heapq
 import itertools
 import multiprocessing
 import os
 import shutil
 import sys
 import traceback
-from typing import Any, Dict, List, Optional, Protocol, Self, Tuple, TypeVar, Union
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Self, Tuple, Union
 
 import json5
 
@@ -20,18 +21,24 @@ from . import action_log, lair, parse
 DISCORD_MESSAGE_LIMIT = 1900  # actually 2000, but we leave some space for a header
 DISCORD_EMOJI_COST = 21
 
-T = TypeVar("T")
 
-
-def perms(it: List[T]) -> List[List[T]]:
-    if len(it) == 1:
-        return [it]
-    ret = []
-    for i, x in enumerate(it):
-        cp = it[:i] + it[i + 1 :]
-        for p in perms(cp):
-            ret.append([x] + p)
-    return ret
+def distinct_permutations(items: List[str]) -> Iterator[Tuple[str, ...]]:
+    # lexicographic next-permutation, so repeated actions don't produce
+    # duplicate sequences that would only be thrown away.
+    seq = sorted(items)
+    n = len(seq)
+    while True:
+        yield tuple(seq)
+        i = n - 2
+        while i >= 0 and seq[i] >= seq[i + 1]:
+            i -= 1
+        if i < 0:
+            return
+        j = n - 1
+        while seq[j] <= seq[i]:
+            j -= 1
+        seq[i], seq[j] = seq[j], seq[i]
+        seq[i + 1 :] = reversed(seq[i + 1 :])
 
 
 def landdiff(
@@ -40,12 +47,7 @@ def landdiff(
     args: argparse.Namespace,
 ) -> str:
     assert a.key == b.key
-    if (
-        a.explorers.cnt == b.explorers.cnt
-        and a.towns.cnt == b.towns.cnt
-        and a.cities.cnt == b.cities.cnt
-        and a.dahan.cnt == b.dahan.cnt
-    ):
+    if a.counts == b.counts:
         if not args.diff_all:
             return ""
         bstr = "UNCHANGED"
@@ -258,14 +260,14 @@ def cat_cafe(finallair: lair.LairState, parser: parse.Parser) -> None:
     r0 = parser.parse_initial_lair()
     w.writerow(
         CatCafeRow(
-            explorers_diff=r0.explorers.cnt,
-            towns_diff=r0.towns.cnt,
-            cities_diff=r0.cities.cnt,
-            dahan_diff=r0.dahan.cnt,
-            explorers_total=r0.explorers.cnt,
-            towns_total=r0.towns.cnt,
-            cities_total=r0.cities.cnt,
-            dahan_total=r0.dahan.cnt,
+            explorers_diff=r0.counts[lair.EXPLORER],
+            towns_diff=r0.counts[lair.TOWN],
+            cities_diff=r0.counts[lair.CITY],
+            dahan_diff=r0.counts[lair.DAHAN],
+            explorers_total=r0.counts[lair.EXPLORER],
+            towns_total=r0.counts[lair.TOWN],
+            cities_total=r0.counts[lair.CITY],
+            dahan_total=r0.counts[lair.DAHAN],
             source="LAIR",
             action="From last phase",
         ).to_csv()
@@ -323,25 +325,25 @@ def cat_cafe(finallair: lair.LairState, parser: parse.Parser) -> None:
             return 0
 
         for src, tgt, cnt in entry.pieces():
-            row.explorers_diff -= piece_diff(lair.Explorer, src, cnt) * src_mult
-            row.towns_diff -= piece_diff(lair.Town, src, cnt) * src_mult
-            row.cities_diff -= piece_diff(lair.City, src, cnt) * src_mult
-            row.dahan_diff -= piece_diff(lair.Dahan, src, cnt) * src_mult
-
-            row.explorers_diff += piece_diff(lair.Explorer, tgt, cnt) * tgt_mult
-            row.towns_diff += piece_diff(lair.Town, tgt, cnt) * tgt_mult
-            row.cities_diff += piece_diff(lair.City, tgt, cnt) * tgt_mult
-            row.dahan_diff += piece_diff(lair.Dahan, tgt, cnt) * tgt_mult
-
-        r0.explorers.cnt += row.explorers_diff
-        r0.towns.cnt += row.towns_diff
-        r0.cities.cnt += row.cities_diff
-        r0.dahan.cnt += row.dahan_diff
-
-        row.explorers_total = r0.explorers.cnt
-        row.towns_total = r0.towns.cnt
-        row.cities_total = r0.cities.cnt
-        row.dahan_total = r0.dahan.cnt
+            row.explorers_diff -= piece_diff(lair.EXPLORER, src, cnt) * src_mult
+            row.towns_diff -= piece_diff(lair.TOWN, src, cnt) * src_mult
+            row.cities_diff -= piece_diff(lair.CITY, src, cnt) * src_mult
+            row.dahan_diff -= piece_diff(lair.DAHAN, src, cnt) * src_mult
+
+            row.explorers_diff += piece_diff(lair.EXPLORER, tgt, cnt) * tgt_mult
+            row.towns_diff += piece_diff(lair.TOWN, tgt, cnt) * tgt_mult
+            row.cities_diff += piece_diff(lair.CITY, tgt, cnt) * tgt_mult
+            row.dahan_diff += piece_diff(lair.DAHAN, tgt, cnt) * tgt_mult
+
+        r0.counts[lair.EXPLORER] += row.explorers_diff
+        r0.counts[lair.TOWN] += row.towns_diff
+        r0.counts[lair.CITY] += row.cities_diff
+        r0.counts[lair.DAHAN] += row.dahan_diff
+
+        row.explorers_total = r0.counts[lair.EXPLORER]
+        row.towns_total = r0.counts[lair.TOWN]
+        row.cities_total = r0.counts[lair.CITY]
+        row.dahan_total = r0.counts[lair.DAHAN]
 
         w.writerow(row.to_csv())
 
@@ -421,13 +423,30 @@ _ravages_per_action = {
 
 
 ActionSeqResult = Tuple[Tuple[str, ...], lair.LairState, lair.LairState]
+ActionSeqScore = Tuple[Tuple[str, ...], Comparable]
+Parsed = Tuple[lair.Lair, parse.DelayedActions]
+
+
+def clone_parsed(parsed: Parsed) -> Parsed:
+    thelair, delayed = parsed
+    # the maps, configs and distances are never modified after parsing, so
+    # every clone can share them instead of copying the whole map.
+    shared: List[object] = [
+        thelair.map,
+        thelair.conf,
+        thelair.state.dist,
+        thelair.state.real_dist,
+        delayed.parse_conf,
+    ]
+    memo: Dict[int, Any] = {id(obj): obj for obj in shared}
+    return copy.deepcopy(parsed, memo)
 
 
 def run_action_seq(
-    parser: parse.Parser,
+    parsed: Parsed,
     action_seq: Tuple[str, ...],
 ) -> ActionSeqResult:
-    thelair, delayed = parser.parse_all()
+    thelair, delayed = clone_parsed(parsed)
     thelair.set_expected_ravages(
         1 + sum(_ravages_per_action.get(action, 0) for action in action_seq)
     )
@@ -435,21 +454,34 @@ def run_action_seq(
     for action in action_seq:
         getattr(thelair, action)()
         delayed.run(action)
-    preravage = copy.deepcopy(thelair.state)
+    preravage = thelair.state.clone()
     thelair.ravage()
     return action_seq, preravage, thelair.state
 
 
+# the pool pickles the Worker into every task chunk, so the parsed turn can't
+# live on the instance; keep it per process instead. it's parsed on the first
+# task rather than in a pool initializer, since an initializer that raises
+# (e.g. on bad turn data) makes the pool respawn its workers forever.
+_worker_parsed: Optional[Parsed] = None
+
+
 class Worker:
-    def __init__(self, parser: parse.Parser):
+    def __init__(self, parser: parse.Parser, log_enabled: bool):
         self.parser = parser
+        self.log_enabled = log_enabled
 
     def __call__(
         self,
         action_seq: Tuple[str, ...],
-    ) -> ActionSeqResult:
+    ) -> ActionSeqScore:
+        global _worker_parsed
         try:
-            return run_action_seq(self.parser, action_seq)
+            if _worker_parsed is None:
+                _worker_parsed = self.parser.parse_all(self.log_enabled)
+            _, _, postravage = run_action_seq(_worker_parsed, action_seq)
+            # only send back what the search sorts by, not the whole state
+            return action_seq, score(self.parser.lair_conf, postravage)
         except Exception as e:
             # Log the exception and stack trace
             print(f"Exception in worker for action_seq {action_seq}: {e}")
@@ -550,12 +582,11 @@ def main() -> None:
     config_dir = f"config/turn{args.turn}"
     with open(os.path.join(config_dir, "input.json5"), encoding="utf-8") as f:
         input = json5.load(f)
-    res: List[ActionSeqResult] = []
     if args.force_line:
-        action_seqs = set([tuple(args.force_line)])
+        action_seqs = [tuple(args.force_line)]
     else:
-        action_seqs = set(
-            tuple(s) for s in perms(input["actions"] + ["lair_blue", "lair_orange"])
+        action_seqs = list(
+            distinct_permutations(input["actions"] + ["lair_blue", "lair_orange"])
         )
     server_emojis = args.split
     log_prestart = args.output in (
@@ -587,12 +618,36 @@ def main() -> None:
         parse_conf=parse_conf,
     )
 
-    worker = Worker(parser)
+    # logs are only needed for the few lines we display, so search without them
+    # and rerun the winners with a log.
+    worker = Worker(parser, log_enabled=False)
+    # keep only the best results, scored by postravage state. equal scores go
+    # to the later sequence in enumeration order, whatever order they finish in.
+    # --best 0 keeps everything, since the displayed slice is best[-0:].
+    seq_order = {action_seq: i for i, action_seq in enumerate(action_seqs)}
+    best: List[Tuple[Tuple[Comparable, int], Tuple[str, ...]]] = []
     with multiprocessing.Pool(args.workers) as pool:
-        res = pool.map(worker, action_seqs)
-    res.sort(key=lambda pair: score(lair_conf, pair[2]))  # score by postravage state
-
-    for action_seq, preravage, postravage in res[-args.best :]:
+        # same split as Pool.map's default, rounded up so the chunks never
+        # outnumber four per worker; a chunk costs a Worker pickle, not a parse.
+        chunksize = -(-len(action_seqs) // (args.workers * 4))
+        try:
+            for action_seq, seq_score in pool.imap_unordered(
+                worker, action_seqs, chunksize
+            ):
+                heapq.heappush(best, ((seq_score, seq_order[action_seq]), action_seq))
+                if 0 < args.best < len(best):
+                    heapq.heappop(best)
+        except Exception:
+            # a worker failed while chunks are still being fed to the pool, and
+            # terminating it mid-feed can deadlock. let the rest drain first.
+            pool.close()
+            pool.join()
+            raise
+    best.sort()
+
+    parsed = parser.parse_all()
+    for _, action_seq in best[-args.best :]:
+        _, preravage, postravage = run_action_seq(parsed, action_seq)
         if args.postravage:
             thelair = postravage
         else:
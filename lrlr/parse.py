@@ -86,19 +86,19 @@ class CsvAction:
                         conf=lands.lair_conf,
                     )
                     lands.distant[key] = land
-            for piece, added in zip(
-                (land.explorers, land.towns, land.cities, land.dahan),
+            for tipe, added in zip(
+                lair.PIECES,
                 (self.explorers, self.towns, self.cities, self.dahan),
             ):
                 delta = mult * to_int(added)
-                piece.cnt += delta
-                if not allow_negative and piece.cnt < 0:
-                    piece_name = piece.tipe.name(lair.piece_names_text)
-                    orig = piece.cnt - delta
+                land.counts[tipe] += delta
+                if not allow_negative and land.counts[tipe] < 0:
+                    piece_name = lair.piece_names_text.name(tipe)
+                    orig = land.counts[tipe] - delta
                     raise ValueError(
                         f"action {self.action_id} ({self.action_name}) is trying to substract {added} {piece_name} from {land.key}, but there are only {orig}"
                     )
-                assert allow_negative or piece.cnt >= 0, f"land {land.key}"
+                assert allow_negative or land.counts[tipe] >= 0, f"land {land.key}"
 
     def csv_data(self) -> Tuple[str, ...]:
         return dataclasses.astuple(self)
@@ -145,6 +145,11 @@ class DelayedActions:
     def run(self, key: str, log: bool = True) -> None:
         if key not in self.actions:
             return
+        if not self.log.enabled:
+            for action in self.actions[key]:
+                action.run(self.lands)
+            del self.actions[key]
+            return
         pieces = [
             self.lair_conf.piece_names.explorer,
             self.lair_conf.piece_names.town,
@@ -205,7 +210,7 @@ class Parser:
         return open(self._path(basename), encoding="utf-8")
 
     def match_piece(self, piece: lair.PieceType, name: str) -> bool:
-        return piece.name(self.lair_conf.piece_names) == name
+        return self.lair_conf.piece_names.name(piece) == name
 
     def _parse_initial_lair(self) -> Tuple[lair.Land, str]:
         with self._open(self.INITIAL_LAIR) as f:
@@ -238,7 +243,7 @@ class Parser:
             next(it)  # throw away header row
             yield from (CsvAction(*cast(Any, row)) for row in it)
 
-    def parse_all(self) -> Tuple[
+    def parse_all(self, log_enabled: bool = True) -> Tuple[
         lair.Lair,
         DelayedActions,
     ]:
@@ -287,7 +292,7 @@ class Parser:
                 )
                 lands[key] = land
 
-        log = action_log.Actionlog()
+        log = action_log.Actionlog(enabled=log_enabled)
         csv_actions = DelayedActions(lands, self.lair_conf, self.parse_conf, log)
         for action in self.read_actions_csv():
             csv_actions.push(action)